@@ -1,7 +1,11 @@
 import sqlite3
 import os
+import json
+import zlib
 import pandas as pd
+from pathlib import Path
 from datetime import datetime, date
+from contextlib import contextmanager
 
 class Applications: 
 
@@ -11,12 +15,17 @@ class Applications:
             os.makedirs(dirpath)
 
         self.db_path = os.path.join(dirpath, "Applications.db")
+        # inactive cycles are moved here by archive_cycle(); only ATTACHed when needed
+        self.archive_path = os.path.join(dirpath, "Archive.db")
         self.predefined_cycles = ["_".join(cycle.split(" ")) for cycle in predefined_cycles]
 
     def __enter__(self): 
         
-        self.connection = sqlite3.connect(self.db_path)
+        # uri=True lets the archive be ATTACHed read-only via a file: URI
+        self.connection = sqlite3.connect(self.db_path, uri=True)
         self.cursor = self.connection.cursor()
+        # must exist before create_tables so archived predefined cycles aren't recreated
+        self.create_archived()
         self.create_tables()
         self.create_settings()
         self.create_statuses()
@@ -42,6 +51,7 @@ class Applications:
         table_names.remove("user_settings")
         table_names.remove("cycle_statuses")
         table_names.remove("resources")
+        table_names.remove("archived_cycles")
         if "sqlite_sequence" in table_names:
             table_names.remove("sqlite_sequence")
         if full_names:
@@ -50,11 +60,12 @@ class Applications:
 
     def create_tables(self): 
         
+        archived = [cycle.lower() for cycle in self.get_archived_cycles()]
         for cycle in self.predefined_cycles: 
-            self.add_cycle(cycle)
+            if cycle.lower() not in archived:
+                self.add_cycle(cycle)
     
-    def add_cycle(self, cycle_name):
-        cycle_name = self._get_db_cycle(cycle_name)
+    def _create_cycle_table(self, cycle_name):
         create_query = f"""CREATE TABLE IF NOT EXISTS {cycle_name} (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         date TEXT NOT NULL,
@@ -65,6 +76,12 @@ class Applications:
         tags TEXT,
         status TEXT NOT NULL)"""
         self.cursor.execute(create_query)
+
+    def add_cycle(self, cycle_name):
+        if self._is_archived(cycle_name):
+            raise ValueError(f"Cycle {cycle_name} is archived; unarchive it instead of adding it again.")
+        cycle_name = self._get_db_cycle(cycle_name)
+        self._create_cycle_table(cycle_name)
         self.connection.commit()
 
     def delete_cycle(self, cycle_name): 
@@ -87,6 +104,15 @@ class Applications:
         self.cursor.execute(create_query)
         self.connection.commit()
 
+    def create_archived(self):
+        # lightweight index of what lives in the archive db, so listing archived
+        # cycles never requires attaching it
+        create_query = f"""CREATE TABLE IF NOT EXISTS archived_cycles (
+                           cycle TEXT UNIQUE NOT NULL,
+                           archived_on TEXT NOT NULL)"""
+        self.cursor.execute(create_query)
+        self.connection.commit()
+
     def create_resources(self):
         create_query = f"""CREATE TABLE IF NOT EXISTS resources (
                            link TEXT,
@@ -133,6 +159,14 @@ class Applications:
 
         return [" ".join(active[0].split("_")).title() for active in active_cycles]
 
+    def get_inactive_cycles(self):
+        
+        get_query = f"SELECT cycle FROM cycle_statuses WHERE is_active = 0"
+        self.cursor.execute(get_query)
+        inactive_cycles = self.cursor.fetchall()
+
+        return [" ".join(inactive[0].split("_")).title() for inactive in inactive_cycles]
+
     def update_settings(self, setting, new_value):
         # TODO: depending on if there are other settings to add, this will probs. need fixing
         update_query = f"REPLACE INTO user_settings (id, {setting}) VALUES (1, '{new_value}')"
@@ -167,63 +201,115 @@ class Applications:
         
         self.connection.commit()
 
+    def _get_applications_df(self, rows):
+
+        columns = ["ID", "Date", "Position", "Company", "Description", "Link", "Tags", "Status"]
+
+        df = pd.DataFrame(rows, columns=columns).set_index("ID")
+        df["Date"] = pd.to_datetime(df["Date"]).dt.date
+        return df.sort_values(by=["Date"], ascending=[True])
+
     def get_applications(self):
 
         all_applications = {}
-        columns = ["ID", "Date", "Position", "Company", "Description", "Link", "Tags", "Status"]
 
+        # archived cycles are deliberately left out; see get_archived_applications
         for table_name in self.get_table_names(): 
             self.cursor.execute(f"SELECT * FROM {table_name}")
             rows = self.cursor.fetchall()
             full_name = " ".join(table_name.split("_")).title()
 
-            df = pd.DataFrame(rows, columns=columns).set_index("ID")
-            df["Date"] = pd.to_datetime(df["Date"]).dt.date
-            df = df.sort_values(by=["Date"], ascending=[True])
-            all_applications[full_name] = df
+            all_applications[full_name] = self._get_applications_df(rows)
 
         return all_applications
     
-    def get_cycle_df(self, cycle):
+    def _get_active_cycle_df(self, cycle):
+        # active db only, so the stats never load archived rows; they add the frozen totals instead
 
         all_applications = self.get_applications()
 
         if cycle == "All Cycles": 
+            if not all_applications:
+                return self._get_applications_df([])
             return pd.concat([df for df in all_applications.values()], axis=0)
         
         return all_applications[cycle]
+
+    def get_cycle_df(self, cycle):
+
+        if self._is_archived(cycle):
+            return self.get_archived_applications(cycle)
+
+        cycle_df = self._get_active_cycle_df(cycle)
+
+        if cycle == "All Cycles":
+            archived_dfs = [self.get_archived_applications(archived) for archived in self.get_archived_cycles()]
+            cycle_df = pd.concat([cycle_df] + archived_dfs, axis=0)
+        
+        return cycle_df
     
     def get_response_rate(self, cycle):
 
-        cycle_df = self.get_cycle_df(cycle)
-        not_pending_df = cycle_df[cycle_df["Status"] != "🕒 Pending"]
+        if self._is_archived(cycle):
+            stats = self._get_archived_stats(cycle)
+            responses, total = stats["responses"], stats["total"]
+        else:
+            cycle_df = self._get_active_cycle_df(cycle)
+            responses = cycle_df[cycle_df["Status"] != "🕒 Pending"].shape[0]
+            total = cycle_df.shape[0]
 
-        pct = (not_pending_df.shape[0] / cycle_df.shape[0]) * 100 if cycle_df.shape[0] else 0.0
+            if cycle == "All Cycles":
+                stats = self._get_archived_stats()
+                responses += stats["responses"]
+                total += stats["total"]
 
-        return not_pending_df.shape[0], cycle_df.shape[0], round(pct, 2)
+        pct = (responses / total) * 100 if total else 0.0
+
+        return responses, total, round(pct, 2)
     
     def get_acceptance_rate(self, cycle):
         
-        cycle_df = self.get_cycle_df(cycle)
-        not_pending_df = cycle_df[~cycle_df["Status"].isin(["🗣️ Interview", "🕒 Pending"])]
-        accepted_df = not_pending_df[not_pending_df["Status"].isin(["💸 Offer", "🎉 Accepted Offer"])]
-
-        pct = (accepted_df.shape[0] / not_pending_df.shape[0]) * 100 if not_pending_df.shape[0] else 0.0
-
-        return accepted_df.shape[0], not_pending_df.shape[0], round(pct, 2)
+        if self._is_archived(cycle):
+            stats = self._get_archived_stats(cycle)
+            accepted, decided = stats["accepted"], stats["decided"]
+        else:
+            cycle_df = self._get_active_cycle_df(cycle)
+            not_pending_df = cycle_df[~cycle_df["Status"].isin(["🗣️ Interview", "🕒 Pending"])]
+            accepted_df = not_pending_df[not_pending_df["Status"].isin(["💸 Offer", "🎉 Accepted Offer"])]
+            accepted, decided = accepted_df.shape[0], not_pending_df.shape[0]
+
+            if cycle == "All Cycles":
+                stats = self._get_archived_stats()
+                accepted += stats["accepted"]
+                decided += stats["decided"]
+
+        pct = (accepted / decided) * 100 if decided else 0.0
+
+        return accepted, decided, round(pct, 2)
     
     def get_application_counts(self, cycle):
 
-        cycle_df = self.get_cycle_df(cycle)
-        cycle_df["Date"] = pd.to_datetime(cycle_df["Date"]).dt.date
+        if self._is_archived(cycle):
+            daily_counts = self._get_archived_counts(cycle)
+        else:
+            cycle_df = self._get_active_cycle_df(cycle)
+            cycle_df["Date"] = pd.to_datetime(cycle_df["Date"]).dt.date
+            daily_counts = cycle_df["Date"].value_counts()
 
-        apps_over_time = cycle_df["Date"].value_counts().sort_index()
+            if cycle == "All Cycles":
+                daily_counts = daily_counts.add(self._get_archived_counts(), fill_value=0).astype(int)
+
+        apps_over_time = daily_counts.sort_index()
         apps_over_time = apps_over_time.rename_axis("Date").reset_index(name="Applications")
         apps_over_time["Cumulative Applications"] = apps_over_time["Applications"].cumsum()
 
         return apps_over_time
     
     def get_average_apps(self, cycle):
+
+        if self._is_archived(cycle):
+            stats = self._get_archived_stats(cycle)
+            return stats["apps_today"], stats["avg_apps_per_day"]
         
         application_counts = self.get_application_counts(cycle)
 
@@ -239,11 +325,13 @@ class Applications:
             try:
                 apps_today = application_counts[application_counts["Date"] == end_date]["Applications"].values[0]
                 # minus 2 as to not include the current date - average is up to and not including
-                cumulative_apps = application_counts["Cumulative Applications"][application_counts.shape[0] - 2]
+                cumulative_apps = (application_counts["Cumulative Applications"].iloc[-2] 
+                                   if application_counts.shape[0] > 1 else 0)
             except IndexError:
                 apps_today = 0
-                cumulative_apps = application_counts["Cumulative Applications"][application_counts.shape[0] - 1]
-            avg_apps_per_day = round(cumulative_apps / day_delta, 2)
+                cumulative_apps = application_counts["Cumulative Applications"].iloc[-1]
+            # every application on a single date leaves nothing to average over
+            avg_apps_per_day = round(cumulative_apps / day_delta, 2) if day_delta else 0.0
 
         else: 
             avg_apps_per_day = 0.0
@@ -251,6 +339,194 @@ class Applications:
 
         return apps_today, avg_apps_per_day
     
+    @contextmanager
+    def _attached_archive(self, writable=False):
+        # the archive is read-only unless we're moving cycles in or out of it
+        if writable:
+            self.cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+            self.create_archive()
+        else:
+            uri = Path(os.path.abspath(self.archive_path)).as_uri() + "?mode=ro"
+            self.cursor.execute("ATTACH DATABASE ? AS archive", (uri,))
+        try:
+            yield
+        except Exception:
+            self.connection.rollback()
+            raise
+        finally:
+            self.cursor.execute("DETACH DATABASE archive")
+
+    def create_archive(self):
+        # applications are stored as one zlib-compressed JSON blob per cycle, next to
+        # the stats computed when the cycle was archived
+        create_query = f"""CREATE TABLE IF NOT EXISTS archive.cycles (
+                           cycle TEXT UNIQUE NOT NULL,
+                           applications BLOB NOT NULL,
+                           responses INTEGER NOT NULL,
+                           total INTEGER NOT NULL,
+                           accepted INTEGER NOT NULL,
+                           decided INTEGER NOT NULL,
+                           apps_today INTEGER NOT NULL,
+                           avg_apps_per_day REAL NOT NULL)"""
+        self.cursor.execute(create_query)
+        create_query = f"""CREATE TABLE IF NOT EXISTS archive.daily_counts (
+                           cycle TEXT NOT NULL,
+                           date TEXT NOT NULL,
+                           applications INTEGER NOT NULL)"""
+        self.cursor.execute(create_query)
+        self.connection.commit()
+
+    def get_archived_cycles(self, full_names=False):
+
+        self.cursor.execute("SELECT cycle FROM archived_cycles ORDER BY cycle")
+        archived = [row[0] for row in self.cursor.fetchall()]
+
+        if full_names:
+            archived = [" ".join(cycle.split("_")).title() for cycle in archived]
+        return archived
+
+    def _is_archived(self, cycle):
+
+        return self._get_db_cycle(cycle).lower() in [archived.lower() for archived in self.get_archived_cycles()]
+
+    def _get_archived_stats(self, cycle=None):
+        # frozen at archive time; without a cycle, the counts summed over every archived cycle
+        columns = ["responses", "total", "accepted", "decided"]
+        if cycle is not None:
+            columns += ["apps_today", "avg_apps_per_day"]
+
+        if not self.get_archived_cycles():
+            return dict.fromkeys(columns, 0)
+
+        if cycle is None:
+            select = ", ".join(f"SUM({col})" for col in columns)
+            get_query, params = f"SELECT {select} FROM archive.cycles", ()
+        else:
+            get_query = f"SELECT {', '.join(columns)} FROM archive.cycles WHERE cycle = ? COLLATE NOCASE"
+            params = (self._get_db_cycle(cycle),)
+
+        with self._attached_archive():
+            self.cursor.execute(get_query, params)
+            result = self.cursor.fetchone()
+
+        return dict(zip(columns, result))
+
+    def _get_archived_counts(self, cycle=None):
+
+        if not self.get_archived_cycles():
+            return pd.Series(dtype=int)
+
+        if cycle is None:
+            get_query, params = "SELECT date, SUM(applications) FROM archive.daily_counts GROUP BY date", ()
+        else:
+            get_query = "SELECT date, applications FROM archive.daily_counts WHERE cycle = ? COLLATE NOCASE"
+            params = (self._get_db_cycle(cycle),)
+
+        with self._attached_archive():
+            self.cursor.execute(get_query, params)
+            rows = self.cursor.fetchall()
+
+        dates = pd.to_datetime([row[0] for row in rows]).date
+        return pd.Series([row[1] for row in rows], index=dates, dtype=int)
+
+    def get_archived_applications(self, cycle):
+
+        get_query = "SELECT applications FROM archive.cycles WHERE cycle = ? COLLATE NOCASE"
+        with self._attached_archive():
+            self.cursor.execute(get_query, (self._get_db_cycle(cycle),))
+            compressed = self.cursor.fetchone()[0]
+
+        return self._get_applications_df(json.loads(zlib.decompress(compressed)))
+
+    def archive_cycle(self, cycle_name, default_cycle=None, vacuum=True):
+
+        # resolve to the table's actual casing, e.g. "Summer 2024" -> "summer_2024"
+        db_cycle = self._get_db_cycle(cycle_name).lower()
+        matches = [table for table in self.get_table_names() if table.lower() == db_cycle]
+        if not matches:
+            raise ValueError(f"Cycle {cycle_name} does not exist and cannot be archived.")
+        cycle = matches[0]
+        full_name = " ".join(cycle.split("_")).title()
+
+        if full_name.lower() in [active.lower() for active in self.get_active_cycles()]:
+            raise ValueError(f"Cycle {full_name} is still active and cannot be archived.")
+
+        # default_cycle is the caller's fallback for when no default has been saved
+        default_cycle = self.get_setting("default_cycle") or default_cycle
+        if default_cycle and self._get_db_cycle(default_cycle).lower() == db_cycle:
+            raise ValueError(f"Cycle {full_name} is the default cycle and cannot be archived.")
+
+        responses, total, _ = self.get_response_rate(full_name)
+        accepted, decided, _ = self.get_acceptance_rate(full_name)
+        apps_today, avg_apps = self.get_average_apps(full_name)
+        apps_over_time = self.get_application_counts(full_name)
+
+        self.cursor.execute(f"SELECT * FROM {cycle}")
+        applications = zlib.compress(json.dumps(self.cursor.fetchall()).encode("utf-8"), 9)
+        daily_counts = [(cycle, day.isoformat(), int(count)) 
+                        for day, count in zip(apps_over_time["Date"], apps_over_time["Applications"])]
+
+        with self._attached_archive(writable=True):
+            archive_query = f"""REPLACE INTO archive.cycles (cycle, applications, responses, total, accepted, 
+                                                            decided, apps_today, avg_apps_per_day)
+                                VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+            self.cursor.execute(archive_query, (cycle, applications, int(responses), int(total), int(accepted), 
+                                                int(decided), int(apps_today), float(avg_apps)))
+            self.cursor.execute("DELETE FROM archive.daily_counts WHERE cycle = ?", (cycle,))
+            self.cursor.executemany("INSERT INTO archive.daily_counts (cycle, date, applications) VALUES (?, ?, ?)", 
+                                    daily_counts)
+            self.cursor.execute("REPLACE INTO archived_cycles (cycle, archived_on) VALUES (?, ?)", 
+                                (cycle, date.today().isoformat()))
+            self.cursor.execute(f"DROP TABLE {cycle}")
+            # single commit so the move is atomic across both databases
+            self.connection.commit()
+
+        if vacuum:
+            self.vacuum()
+
+    def archive_cycles(self, cycle_names, default_cycle=None):
+
+        # both files are rewritten once for the whole batch rather than once per cycle
+        try:
+            for cycle_name in cycle_names:
+                self.archive_cycle(cycle_name, default_cycle=default_cycle, vacuum=False)
+        finally:
+            self.vacuum()
+
+    def vacuum(self):
+
+        # reclaim archived cycles' pages so the active db only holds active cycles
+        self.cursor.execute("VACUUM")
+        if os.path.isfile(self.archive_path):
+            with self._attached_archive(writable=True):
+                self.cursor.execute("VACUUM archive")
+
+    def unarchive_cycle(self, cycle_name):
+
+        db_cycle = self._get_db_cycle(cycle_name).lower()
+        matches = [archived for archived in self.get_archived_cycles() if archived.lower() == db_cycle]
+        if not matches:
+            raise ValueError(f"Cycle {cycle_name} is not archived and cannot be unarchived.")
+        cycle = matches[0]
+
+        if cycle.lower() in [table.lower() for table in self.get_table_names()]:
+            raise ValueError(f"Cycle {cycle_name} already exists in the active database and cannot be unarchived.")
+
+        with self._attached_archive(writable=True):
+            self.cursor.execute("SELECT applications FROM archive.cycles WHERE cycle = ?", (cycle,))
+            rows = json.loads(zlib.decompress(self.cursor.fetchone()[0]))
+
+            self.cursor.execute("DELETE FROM archived_cycles WHERE cycle = ?", (cycle,))
+            self._create_cycle_table(cycle)
+            # original ids are kept so the restored cycle matches what was archived
+            insert_query = f"""INSERT INTO {cycle} (id, date, position, company, description, link, tags, status)
+                               VALUES (?, ?, ?, ?, ?, ?, ?, ?)"""
+            self.cursor.executemany(insert_query, rows)
+            self.cursor.execute("DELETE FROM archive.cycles WHERE cycle = ?", (cycle,))
+            self.cursor.execute("DELETE FROM archive.daily_counts WHERE cycle = ?", (cycle,))
+            self.connection.commit()
+            self.cursor.execute("VACUUM archive")
+
     def add_resource(self, updates):
         pass
 
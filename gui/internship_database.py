@@ -164,6 +164,8 @@ if st.session_state["authentication_status"]:
         default = applications.get_setting("default_cycle")
         DEFAULT_CYCLE = default if default else DEFAULT_CYCLE
         ACTIVE_CYCLES = applications.get_active_cycles()
+        INACTIVE_CYCLES = applications.get_inactive_cycles()
+        ARCHIVED_CYCLES = applications.get_archived_cycles(full_names=True)
 
     with st.sidebar: 
         add_tab, settings_tab = st.tabs(["Add Application", "Settings"])
@@ -240,7 +242,7 @@ if st.session_state["authentication_status"]:
                           on_change=clear_cycle)
             
             if st.session_state.added_cycle: 
-                if st.session_state.added_cycle.lower() not in [cycle.lower() for cycle in cycles]:
+                if st.session_state.added_cycle.lower() not in [cycle.lower() for cycle in cycles + ARCHIVED_CYCLES]:
                     with Applications(dirpath=PATH, predefined_cycles=CYCLES) as applications: 
                         applications.add_cycle(st.session_state.added_cycle)
                     st.success(f"Cycle {st.session_state.added_cycle} successfully added. Refresh to view changes.")
@@ -271,6 +273,31 @@ if st.session_state["authentication_status"]:
                 with Applications(dirpath=PATH, predefined_cycles=CYCLES) as applications:
                     applications.update_statuses(st.session_state.active_cycles)
 
+            st.divider()
+
+            # archived cycles leave the main database, but their stats stay viewable
+            st.multiselect("Archive inactive cycle(s)", 
+                           options=[cycle for cycle in cycles 
+                                    if cycle in INACTIVE_CYCLES and cycle != DEFAULT_CYCLE], 
+                           placeholder="Select one or more inactive cycles",
+                           key="cycles_to_archive")
+            submit_archive_cycles = st.button("Archive cycle(s)")
+            if submit_archive_cycles and st.session_state.cycles_to_archive: 
+                with Applications(dirpath=PATH, predefined_cycles=CYCLES) as applications:
+                    applications.archive_cycles(st.session_state.cycles_to_archive, default_cycle=DEFAULT_CYCLE)
+                st.success(f"Cycle(s) {', '.join(st.session_state.cycles_to_archive)} archived. Refresh to view changes.")
+
+            st.selectbox("Unarchive cycle", 
+                options=ARCHIVED_CYCLES,
+                index=None,
+                placeholder="Select an archived cycle",
+                key="cycle_to_unarchive")
+            submit_unarchive_cycle = st.button("Unarchive cycle")
+            if submit_unarchive_cycle and st.session_state.cycle_to_unarchive: 
+                with Applications(dirpath=PATH, predefined_cycles=CYCLES) as applications:
+                    applications.unarchive_cycle(st.session_state.cycle_to_unarchive)
+                st.success(f"Cycle {st.session_state.cycle_to_unarchive} unarchived. Refresh to view changes.")
+
     database_tab, stats_tab, resources_tab = st.tabs(["Your Internships", "Statistics and Trends", "Resources"])
     with database_tab: 
         col1, col2, col3 = st.columns(3)
@@ -302,7 +329,7 @@ if st.session_state["authentication_status"]:
     with stats_tab: 
         col1, col2, col3 = st.columns(3)
         col1.selectbox("Application cycle", 
-                       options=cycles + ["All Cycles"],
+                       options=cycles + ARCHIVED_CYCLES + ["All Cycles"],
                        key="stats_cycle", 
                        index=cycles.index(DEFAULT_CYCLE))
         st.markdown(f"### Your {st.session_state.stats_cycle} Statistics")